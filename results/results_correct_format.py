@@ -5,6 +5,17 @@ Based on the exam specification template.
 """
 
 import json
+import os
+from pathlib import Path
+
+# orjson is optional; it serializes in C and is used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Numbered categories -> named categories used by the exam format
+_RENAME = {'1': 'antisemitic', '0': 'non_antisemitic'}
 
 
 def create_correct_results_format(analysis_data):
@@ -39,43 +50,20 @@ def create_correct_results_format(analysis_data):
     }
     """
 
-    # Convert the numbered categories to named categories
-    def convert_category_name(category_key):
-        if category_key == '1':
-            return 'antisemitic'
-        elif category_key == '0':
-            return 'non_antisemitic'
-        else:
-            return category_key
-
-    # Build the correct format
     correct_format = {}
 
     # 1. Total tweets - convert format
     if 'total_tweets' in analysis_data:
-        tweet_counts = analysis_data['total_tweets']
-        correct_format['total_tweets'] = {}
-
-        for key, value in tweet_counts.items():
-            if key in ['1', '0']:
-                new_key = convert_category_name(key)
-                correct_format['total_tweets'][new_key] = value
-            elif key == 'unspecified':
-                correct_format['total_tweets']['unspecified'] = value
-            elif key == 'total':
-                correct_format['total_tweets']['total'] = value
-
-    # 2. Average length - convert format
-    if 'average_length' in analysis_data:
-        avg_lengths = analysis_data['average_length']
-        correct_format['average_length'] = {}
+        correct_format['total_tweets'] = {
+            _RENAME.get(k, k): v for k, v in analysis_data['total_tweets'].items()
+        }
 
-        for key, value in avg_lengths.items():
-            if key in ['1', '0']:
-                new_key = convert_category_name(key)
-                correct_format['average_length'][new_key] = round(value, 1)
-            elif key == 'total':
-                correct_format['average_length']['total'] = round(value, 1)
+    # 2. Average length - convert format and round
+    if 'average_length' in analysis_data:
+        correct_format['average_length'] = {
+            _RENAME.get(k, k): round(v, 1) if isinstance(v, (int, float)) else v
+            for k, v in analysis_data['average_length'].items()
+        }
 
     # 3. Common words - IMPORTANT: exam wants it wrapped in "total" key
     if 'common_words' in analysis_data:
@@ -85,25 +73,15 @@ def create_correct_results_format(analysis_data):
 
     # 4. Longest tweets - convert format
     if 'longest_3_tweets' in analysis_data:
-        longest_tweets = analysis_data['longest_3_tweets']
-        correct_format['longest_3_tweets'] = {}
-
-        for key, value in longest_tweets.items():
-            if key in ['1', '0']:
-                new_key = convert_category_name(key)
-                correct_format['longest_3_tweets'][new_key] = value
+        correct_format['longest_3_tweets'] = {
+            _RENAME.get(k, k): v for k, v in analysis_data['longest_3_tweets'].items()
+        }
 
     # 5. Uppercase words - convert format
     if 'uppercase_words' in analysis_data:
-        uppercase_counts = analysis_data['uppercase_words']
-        correct_format['uppercase_words'] = {}
-
-        for key, value in uppercase_counts.items():
-            if key in ['1', '0']:
-                new_key = convert_category_name(key)
-                correct_format['uppercase_words'][new_key] = value
-            elif key == 'total':
-                correct_format['uppercase_words']['total'] = value
+        correct_format['uppercase_words'] = {
+            _RENAME.get(k, k): v for k, v in analysis_data['uppercase_words'].items()
+        }
 
     return correct_format
 
@@ -119,15 +97,19 @@ def save_results_correct_format(analysis_results, output_path="results/results.j
     # Convert to correct format
     correct_results = create_correct_results_format(analysis_results)
 
-    # Save with proper formatting
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(correct_results, f, indent=4, ensure_ascii=False)
+    # Serialize once and write the bytes in a single call
+    if orjson is not None:
+        data = orjson.dumps(correct_results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(correct_results, indent=2, ensure_ascii=False).encode('utf-8')
+    Path(output_path).write_bytes(data)
 
     print(f"✅ Results saved in correct format: {output_path}")
 
-    # Show a preview
-    print("📋 Results preview:")
-    print(json.dumps(correct_results, indent=2)[:500] + "...")
+    # Optional preview, sliced from the bytes already written (no re-serialization)
+    if os.getenv('RESULTS_PREVIEW'):
+        print("📋 Results preview:")
+        print(data[:500].decode('utf-8', errors='ignore') + "...")
 
     return correct_results
 
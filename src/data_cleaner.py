@@ -1,8 +1,22 @@
 # src/data_cleaner.py
+import logging
 import pandas as pd
 import string
 import re
-from typing import List
+from typing import Callable, List
+
+from util_kernels import HAS_NUMBA, build_ascii_clean_table, clean_ascii_texts
+
+logger = logging.getLogger(__name__)
+
+# Translation table for punctuation removal, built once per process
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# Runs of whitespace, collapsed to a single space during cleaning
+_WS_RE = re.compile(r'\s+')
+
+# Byte lookup table for the Numba normalization kernel (same punctuation set)
+_ASCII_CLEAN_TABLE = build_ascii_clean_table(string.punctuation)
 
 
 class DataCleaner:
@@ -13,7 +27,7 @@ class DataCleaner:
 
     @staticmethod
     def delete_unclassified(
-            data: pd.DataFrame, columns_to_delete_unclassified: List[str]
+            data: pd.DataFrame, columns_to_delete_unclassified: List[str], inplace: bool = False
     ) -> pd.DataFrame:
         """
         Remove rows with missing values in specified columns.
@@ -21,30 +35,38 @@ class DataCleaner:
         Args:
             data: Input DataFrame
             columns_to_delete_unclassified: Columns to check for missing values
+            inplace: Modify data directly instead of returning a new DataFrame
 
         Returns:
             DataFrame without unclassified entries
         """
-        if not columns_to_delete_unclassified:
-            return data.copy()
+        cleaned_data = data if inplace else data.copy(deep=False)
 
-        cleaned_data = data.copy()
+        if not columns_to_delete_unclassified:
+            return cleaned_data
 
         # Check which columns exist
         existing_columns = [col for col in columns_to_delete_unclassified if col in data.columns]
 
         if not existing_columns:
-            print(f"⚠️ Warning: None of the specified columns found: {columns_to_delete_unclassified}")
+            logger.warning("None of the specified columns found: %s", columns_to_delete_unclassified)
+            return cleaned_data
+
+        # Fast path: nothing to drop, so skip the row reallocation
+        if not cleaned_data[existing_columns].isna().any().any():
             return cleaned_data
 
         # Remove rows with NaN in specified columns
-        cleaned_data = cleaned_data.dropna(subset=existing_columns)
+        if inplace:
+            cleaned_data.dropna(subset=existing_columns, inplace=True)
+        else:
+            cleaned_data = cleaned_data.dropna(subset=existing_columns)
 
         return cleaned_data
 
     @staticmethod
     def convert_to_lowercase(
-            data: pd.DataFrame, columns_to_lowercase: List[str]
+            data: pd.DataFrame, columns_to_lowercase: List[str], inplace: bool = False
     ) -> pd.DataFrame:
         """
         Convert text in specified columns to lowercase.
@@ -52,42 +74,29 @@ class DataCleaner:
         Args:
             data: Input DataFrame
             columns_to_lowercase: List of columns to convert
+            inplace: Replace the columns on data directly instead of on a shallow copy
 
         Returns:
             DataFrame with lowercase text
         """
-        cleaned_data = data.copy()
+        # Columns are replaced, never mutated, so a shallow copy keeps data untouched
+        cleaned_data = data if inplace else data.copy(deep=False)
 
         for col in columns_to_lowercase:
             if col not in cleaned_data.columns:
-                print(f"⚠️ Warning: Column '{col}' not found, skipping lowercase conversion")
+                logger.warning("Column '%s' not found, skipping lowercase conversion", col)
                 continue
 
-            # Convert to string first, then lowercase
-            cleaned_data[col] = cleaned_data[col].astype(str).apply(
-                lambda x: DataCleaner._safe_lowercase(x)
+            # Fill missing values once, then lowercase with the vectorized accessor
+            cleaned_data[col] = DataCleaner._apply_uniques(
+                DataCleaner._as_text(cleaned_data[col]), lambda s: s.str.lower()
             )
 
         return cleaned_data
 
-    @staticmethod
-    def _safe_lowercase(text: str) -> str:
-        """
-        Safely convert text to lowercase, handling special cases.
-
-        Args:
-            text: Input text
-
-        Returns:
-            Lowercase text
-        """
-        if pd.isna(text) or text == 'nan':
-            return ''
-        return str(text).lower()
-
     @staticmethod
     def removing_punctuation_marks(
-            data: pd.DataFrame, columns_to_remove_punctuation: List[str]
+            data: pd.DataFrame, columns_to_remove_punctuation: List[str], inplace: bool = False
     ) -> pd.DataFrame:
         """
         Remove punctuation from specified text columns.
@@ -95,46 +104,28 @@ class DataCleaner:
         Args:
             data: Input DataFrame
             columns_to_remove_punctuation: List of columns to process
+            inplace: Replace the columns on data directly instead of on a shallow copy
 
         Returns:
             DataFrame with punctuation removed
         """
-        cleaned_data = data.copy()
-
-        # Create translation table for punctuation removal
-        translator = str.maketrans('', '', string.punctuation)
+        cleaned_data = data if inplace else data.copy(deep=False)
 
         for col in columns_to_remove_punctuation:
             if col not in cleaned_data.columns:
-                print(f"⚠️ Warning: Column '{col}' not found, skipping punctuation removal")
+                logger.warning("Column '%s' not found, skipping punctuation removal", col)
                 continue
 
             # Apply punctuation removal
-            cleaned_data[col] = cleaned_data[col].astype(str).apply(
-                lambda x: DataCleaner._safe_remove_punctuation(x, translator)
+            cleaned_data[col] = DataCleaner._apply_uniques(
+                DataCleaner._as_text(cleaned_data[col]), lambda s: s.str.translate(_PUNCT_TABLE)
             )
 
         return cleaned_data
 
-    @staticmethod
-    def _safe_remove_punctuation(text: str, translator) -> str:
-        """
-        Safely remove punctuation from text.
-
-        Args:
-            text: Input text
-            translator: String translation table
-
-        Returns:
-            Text without punctuation
-        """
-        if pd.isna(text) or text == 'nan':
-            return ''
-        return str(text).translate(translator)
-
     @staticmethod
     def deleting_columns(
-            data: pd.DataFrame, columns_to_drop: List[str]
+            data: pd.DataFrame, columns_to_drop: List[str], inplace: bool = False, verbose: bool = True
     ) -> pd.DataFrame:
         """
         Remove specified columns from DataFrame.
@@ -142,28 +133,37 @@ class DataCleaner:
         Args:
             data: Input DataFrame
             columns_to_drop: List of columns to remove
+            inplace: Drop the columns from data directly instead of returning a new DataFrame
+            verbose: Log which columns were dropped or not found
 
         Returns:
             DataFrame without specified columns
         """
-        cleaned_data = data.copy()
-
-        # Check which columns actually exist
+        # Check which columns actually exist (single pass; missing ones are only listed when verbose)
         existing_columns_to_drop = [col for col in columns_to_drop if col in data.columns]
-        non_existing_columns = [col for col in columns_to_drop if col not in data.columns]
 
-        if non_existing_columns:
-            print(f"⚠️ Warning: Columns not found (skipping): {non_existing_columns}")
+        if verbose and len(existing_columns_to_drop) != len(columns_to_drop):
+            non_existing_columns = [col for col in columns_to_drop if col not in data.columns]
+            if non_existing_columns:
+                logger.warning("Columns not found (skipping): %s", non_existing_columns)
 
-        if existing_columns_to_drop:
-            cleaned_data = cleaned_data.drop(columns=existing_columns_to_drop, errors='ignore')
-            print(f"✅ Dropped columns: {existing_columns_to_drop}")
+        if not existing_columns_to_drop:
+            return data if inplace else data.copy(deep=False)
+
+        if inplace:
+            data.drop(columns=existing_columns_to_drop, inplace=True)
+            cleaned_data = data
+        else:
+            cleaned_data = data.drop(columns=existing_columns_to_drop)
+
+        if verbose:
+            logger.info("✅ Dropped columns: %s", existing_columns_to_drop)
 
         return cleaned_data
 
     @staticmethod
     def remove_extra_whitespace(
-            data: pd.DataFrame, columns_to_clean: List[str]
+            data: pd.DataFrame, columns_to_clean: List[str], inplace: bool = False
     ) -> pd.DataFrame:
         """
         Remove extra whitespace from text columns.
@@ -171,41 +171,53 @@ class DataCleaner:
         Args:
             data: Input DataFrame
             columns_to_clean: List of columns to clean
+            inplace: Replace the columns on data directly instead of on a shallow copy
 
         Returns:
             DataFrame with normalized whitespace
         """
-        cleaned_data = data.copy()
+        cleaned_data = data if inplace else data.copy(deep=False)
 
         for col in columns_to_clean:
             if col not in cleaned_data.columns:
-                print(f"⚠️ Warning: Column '{col}' not found, skipping whitespace cleaning")
+                logger.warning("Column '%s' not found, skipping whitespace cleaning", col)
                 continue
 
-            # Remove extra whitespace and strip
-            cleaned_data[col] = cleaned_data[col].astype(str).apply(
-                lambda x: DataCleaner._clean_whitespace(x)
+            # Replace multiple whitespace with single space and strip
+            cleaned_data[col] = DataCleaner._apply_uniques(
+                DataCleaner._as_text(cleaned_data[col]),
+                lambda s: s.str.replace(_WS_RE, ' ', regex=True).str.strip()
             )
 
         return cleaned_data
 
     @staticmethod
-    def _clean_whitespace(text: str) -> str:
+    def normalize_text(
+            data: pd.DataFrame, columns_to_clean: List[str], inplace: bool = False
+    ) -> pd.DataFrame:
         """
-        Clean whitespace from text.
+        Remove punctuation, lowercase and collapse whitespace in text columns in one pass.
+        Gives the same result as removing_punctuation_marks, convert_to_lowercase and
+        remove_extra_whitespace applied in that order.
 
         Args:
-            text: Input text
+            data: Input DataFrame
+            columns_to_clean: List of columns to clean
+            inplace: Replace the columns on data directly instead of on a shallow copy
 
         Returns:
-            Text with normalized whitespace
+            DataFrame with normalized text
         """
-        if pd.isna(text) or text == 'nan':
-            return ''
+        cleaned_data = data if inplace else data.copy(deep=False)
 
-        # Replace multiple whitespace with single space and strip
-        cleaned = re.sub(r'\s+', ' ', str(text)).strip()
-        return cleaned
+        for col in columns_to_clean:
+            if col not in cleaned_data.columns:
+                logger.warning("Column '%s' not found, skipping text normalization", col)
+                continue
+
+            cleaned_data[col] = DataCleaner._normalize_text(cleaned_data[col].fillna(''))
+
+        return cleaned_data
 
     @staticmethod
     def remove_empty_entries(
@@ -221,21 +233,110 @@ class DataCleaner:
         Returns:
             DataFrame without empty entries
         """
-        cleaned_data = data.copy()
+        existing_columns = [col for col in columns_to_check if col in data.columns]
+        if not existing_columns:
+            return data.copy(deep=False)
 
-        for col in columns_to_check:
-            if col not in cleaned_data.columns:
-                continue
+        # Build one combined mask, then filter the rows once
+        mask = pd.Series(True, index=data.index)
+        for col in existing_columns:
+            # Keep rows where the column has non-whitespace content
+            text = DataCleaner._as_text(data[col])
+            mask &= text.str.strip().ne('')
 
-            # Remove rows where the column is empty or whitespace only
-            mask = (
-                    cleaned_data[col].notna() &
-                    (cleaned_data[col].astype(str).str.strip() != '') &
-                    (cleaned_data[col].astype(str) != 'nan')
-            )
-            cleaned_data = cleaned_data[mask]
+        # Fast path: every row has content, so skip the slice
+        if mask.all():
+            return data.copy(deep=False)
 
-        return cleaned_data
+        return data[mask]
+
+    @staticmethod
+    def _as_text(series: pd.Series, fill_missing: bool = True) -> pd.Series:
+        """
+        Fill missing values and cast to str only when the column is not already text.
+
+        Args:
+            series: Input column
+            fill_missing: Replace missing values with empty strings (skip if already filled)
+
+        Returns:
+            Text column without missing values
+        """
+        # A categorical cannot take '' as a fill value unless it is already a category
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(object)
+        if fill_missing:
+            series = series.fillna('')
+        if not pd.api.types.is_string_dtype(series):
+            series = series.astype(str)
+        return series
+
+    @staticmethod
+    def _apply_uniques(series: pd.Series, fn: Callable[[pd.Series], pd.Series]) -> pd.Series:
+        """
+        Apply a column transformation to the distinct values only, then gather back.
+        For tweet data with many duplicates this does O(unique) work instead of O(rows).
+
+        Args:
+            series: Input column without missing values
+            fn: Vectorized transformation from Series to Series of the same length
+
+        Returns:
+            Transformed column aligned with the input index
+        """
+        codes, uniques = pd.factorize(series)
+        return fn(pd.Series(uniques)).take(codes).set_axis(series.index)
+
+    @staticmethod
+    def _normalize_text(series: pd.Series) -> pd.Series:
+        """
+        Remove punctuation, lowercase and collapse whitespace in one chain.
+        Duplicate texts (retweets, copy-pasted tweets) are normalized only once.
+
+        Args:
+            series: Input text column, with missing values already filled
+
+        Returns:
+            Normalized text column
+        """
+        normalize = DataCleaner._normalize_with_kernel if HAS_NUMBA else DataCleaner._normalize_with_pandas
+        return DataCleaner._apply_uniques(DataCleaner._as_text(series, fill_missing=False), normalize)
+
+    @staticmethod
+    def _normalize_with_pandas(series: pd.Series) -> pd.Series:
+        """
+        Normalization chain built from vectorized pandas string operations.
+
+        Args:
+            series: Input text column without missing values
+
+        Returns:
+            Normalized text column
+        """
+        return (
+            series.str.translate(_PUNCT_TABLE)
+            .str.lower()
+            .str.replace(_WS_RE, ' ', regex=True)
+            .str.strip()
+        )
+
+    @staticmethod
+    def _normalize_with_kernel(series: pd.Series) -> pd.Series:
+        """
+        Normalize ASCII rows with the Numba byte kernel in a single pass,
+        falling back to the pandas chain for rows with non-ASCII characters.
+
+        Args:
+            series: Input text column without missing values
+
+        Returns:
+            Normalized text column
+        """
+        cleaned, needs_fallback = clean_ascii_texts(series.tolist(), _ASCII_CLEAN_TABLE)
+        normalized = pd.Series(cleaned, index=series.index, dtype=series.dtype)
+        if needs_fallback.any():
+            normalized[needs_fallback] = DataCleaner._normalize_with_pandas(series[needs_fallback])
+        return normalized
 
     @staticmethod
     def comprehensive_text_cleaning(
@@ -256,45 +357,55 @@ class DataCleaner:
         Returns:
             Comprehensively cleaned DataFrame
         """
-        print("🧹 Starting comprehensive text cleaning...")
+        # Progress lines are collected and emitted as a single log record at the end
+        log_lines = ["🧹 Starting comprehensive text cleaning..."]
 
-        cleaned_data = data.copy()
+        # Single shallow copy at the entry; every step below works on it in place
+        cleaned_data = data.copy(deep=False)
         original_rows = len(cleaned_data)
 
         # Step 1: Remove unclassified if requested
         if remove_unclassified and classification_columns:
-            print(f"  📋 Removing unclassified entries...")
-            cleaned_data = DataCleaner.delete_unclassified(cleaned_data, classification_columns)
+            log_lines.append("  📋 Removing unclassified entries...")
+            DataCleaner.delete_unclassified(cleaned_data, classification_columns, inplace=True)
             removed_unclassified = original_rows - len(cleaned_data)
             if removed_unclassified > 0:
-                print(f"    ✂️ Removed {removed_unclassified:,} unclassified rows")
+                log_lines.append(f"    ✂️ Removed {removed_unclassified:,} unclassified rows")
 
-        # Step 2: Remove punctuation from text columns
-        print(f"  🔤 Removing punctuation...")
-        cleaned_data = DataCleaner.removing_punctuation_marks(cleaned_data, text_columns)
+        # Steps 2-4: Remove punctuation, lowercase and clean whitespace in a single pass
+        log_lines.append("  🔤 Normalizing text (punctuation, lowercase, whitespace)...")
+        existing_text_columns = []
+        for col in text_columns:
+            if col not in cleaned_data.columns:
+                logger.warning("Column '%s' not found, skipping text normalization", col)
+                continue
+            existing_text_columns.append(col)
 
-        # Step 3: Convert to lowercase
-        print(f"  🔡 Converting to lowercase...")
-        cleaned_data = DataCleaner.convert_to_lowercase(cleaned_data, text_columns)
+        # Fill missing text once so the normalization chain needs no NaN handling
+        if existing_text_columns:
+            cleaned_data[existing_text_columns] = cleaned_data[existing_text_columns].fillna('')
 
-        # Step 4: Clean whitespace
-        print(f"  🧽 Cleaning whitespace...")
-        cleaned_data = DataCleaner.remove_extra_whitespace(cleaned_data, text_columns)
+        for col in existing_text_columns:
+            cleaned_data[col] = DataCleaner._normalize_text(cleaned_data[col])
 
-        # Step 5: Remove empty entries
-        print(f"  🗑️ Removing empty entries...")
+        # Step 5: Remove empty entries with one combined mask
+        log_lines.append("  🗑️ Removing empty entries...")
         before_empty_removal = len(cleaned_data)
-        cleaned_data = DataCleaner.remove_empty_entries(cleaned_data, text_columns)
+        if existing_text_columns:
+            cleaned_data = cleaned_data[cleaned_data[existing_text_columns].ne('').all(axis=1)]
         removed_empty = before_empty_removal - len(cleaned_data)
         if removed_empty > 0:
-            print(f"    ✂️ Removed {removed_empty:,} empty text rows")
-
-        final_rows = len(cleaned_data)
-        total_removed = original_rows - final_rows
-
-        print(f"✅ Cleaning completed:")
-        print(f"    📊 Original: {original_rows:,} rows")
-        print(f"    📊 Final: {final_rows:,} rows")
-        print(f"    📉 Removed: {total_removed:,} rows ({total_removed / original_rows * 100:.1f}%)")
+            log_lines.append(f"    ✂️ Removed {removed_empty:,} empty text rows")
+
+        if logger.isEnabledFor(logging.INFO):
+            final_rows = len(cleaned_data)
+            total_removed = original_rows - final_rows
+            log_lines.extend([
+                "✅ Cleaning completed:",
+                f"    📊 Original: {original_rows:,} rows",
+                f"    📊 Final: {final_rows:,} rows",
+                f"    📉 Removed: {total_removed:,} rows ({total_removed / original_rows * 100:.1f}%)",
+            ])
+            logger.info("\n".join(log_lines))
 
         return cleaned_data
\ No newline at end of file
@@ -1,7 +1,10 @@
 # src/data_details.py
+import logging
 import pandas as pd
 from typing import Dict, Any, List
 
+logger = logging.getLogger(__name__)
+
 
 class DataInformation:
     """
@@ -26,6 +29,7 @@ class DataInformation:
         self._data_details = {}
         self._num_of_columns = self._raw_data.shape[1]
         self._num_of_rows = self._raw_data.shape[0]
+        self._missing_values = None
         self._columns_and_data_types = self._find_columns_and_data_types()
 
     def _find_columns_and_data_types(self) -> Dict[str, str]:
@@ -35,7 +39,7 @@ class DataInformation:
         Returns:
             Dict mapping column names to their data types
         """
-        return {col: str(self._raw_data[col].dtype) for col in self._raw_data.columns}
+        return self._raw_data.dtypes.astype(str).to_dict()
 
     def get_basic_info(self) -> Dict[str, Any]:
         """
@@ -59,7 +63,10 @@ class DataInformation:
         Returns:
             Dictionary with missing value counts per column
         """
-        return self._raw_data.isnull().sum().to_dict()
+        # Computed on first use only; the wrapped DataFrame is not expected to change
+        if self._missing_values is None:
+            self._missing_values = self._raw_data.isnull().sum().to_dict()
+        return dict(self._missing_values)
 
     def get_column_statistics(self, column: str) -> Dict[str, Any]:
         """
@@ -99,31 +106,42 @@ class DataInformation:
             # For text columns, add text-specific stats
             non_null_text = col_data.dropna().astype(str)
             if len(non_null_text) > 0:
-                word_counts = non_null_text.apply(lambda x: len(x.split()))
                 stats.update({
-                    'avg_word_count': word_counts.mean(),
-                    'avg_char_count': non_null_text.apply(len).mean(),
-                    'most_common_values': col_data.value_counts().head(5).to_dict()
+                    'avg_word_count': non_null_text.str.split().str.len().mean(),
+                    'avg_char_count': non_null_text.str.len().mean(),
+                    'most_common_values': col_data.value_counts(dropna=True).head(5).to_dict()
                 })
 
         return stats
 
     def print_summary(self) -> None:
         """
-        Print a comprehensive summary of the dataset.
+        Log a comprehensive summary of the dataset (INFO level).
         """
-        print("=" * 60)
-        print("DATASET INFORMATION SUMMARY")
-        print("=" * 60)
+        # Skip the (deep) memory scan and formatting entirely when INFO is silenced
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
         basic_info = self.get_basic_info()
-        print(f"📊 Shape: {self._num_of_rows:,} rows × {self._num_of_columns} columns")
-        print(f"💾 Memory Usage: {basic_info['memory_usage_mb']} MB")
 
-        print(f"\n📋 Columns:")
+        # One vectorized pass for all columns, shared with get_missing_values_info
+        missing_values = self.get_missing_values_info()
+        total = self._num_of_rows
+
+        lines = [
+            "=" * 60,
+            "DATASET INFORMATION SUMMARY",
+            "=" * 60,
+            f"📊 Shape: {self._num_of_rows:,} rows × {self._num_of_columns} columns",
+            f"💾 Memory Usage: {basic_info['memory_usage_mb']} MB",
+            "",
+            "📋 Columns:",
+        ]
         for col, dtype in self._columns_and_data_types.items():
-            missing = self._raw_data[col].isnull().sum()
-            missing_pct = (missing / len(self._raw_data)) * 100
-            print(f"  • {col:<20} ({dtype:<10}) - {missing:,} missing ({missing_pct:.1f}%)")
+            missing = missing_values[col]
+            missing_pct = (missing / total) * 100
+            lines.append(f"  • {col:<20} ({dtype:<10}) - {missing:,} missing ({missing_pct:.1f}%)")
+        lines.append("=" * 60)
 
-        print("=" * 60)
\ No newline at end of file
+        # Emitted as a single record instead of one write per line
+        logger.info("\n".join(lines))
@@ -1,9 +1,92 @@
+import hashlib
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
 import pandas as pd
 
+# pyarrow is optional; when present it parses CSVs and backs the text columns
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# dtype for text columns: Arrow-backed strings when pyarrow is installed
+TEXT_DTYPE = pd.StringDtype("pyarrow") if _HAS_PYARROW else pd.StringDtype()
+
+# Strings pandas.read_csv reads as missing by default, reused when pyarrow parses the CSV
+_CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+def write_csv(data: pd.DataFrame, path: str) -> None:
+    """
+    Write a dataframe to CSV without the index.
+    With pyarrow the file is written in C straight from the Arrow buffers
+    (string values are always quoted); otherwise pandas to_csv is used.
+
+    Args:
+        data: The data to write
+        path: Destination CSV path
+    """
+    if not _HAS_PYARROW:
+        data.to_csv(path, index=False)
+        return
+
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    pacsv.write_csv(pa.Table.from_pandas(data, preserve_index=False), str(path))
+
+
+def write_csv_chunks(chunks: Iterable[pd.DataFrame], path: str) -> int:
+    """
+    Write dataframes to one CSV as they are produced, so only one chunk is in memory.
+    The header is taken from the first chunk; all chunks must share its columns.
+
+    Args:
+        chunks: The data to write, chunk by chunk
+        path: Destination CSV path
+
+    Returns:
+        Number of rows written
+    """
+    rows = 0
+    if not _HAS_PYARROW:
+        for chunk in chunks:
+            chunk.to_csv(path, index=False, mode="w" if rows == 0 else "a", header=rows == 0)
+            rows += len(chunk)
+        return rows
+
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pacsv.CSVWriter(str(path), table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
 
 class DataHandler:
 
-    def __init__(self, data_path: str, encoding: str = "utf-8"):
+    def __init__(
+            self,
+            data_path: str,
+            encoding: str = "utf-8",
+            cache_dir: str = ".cache",
+            columns: Optional[List[str]] = None,
+            dtype: Optional[Dict[str, Any]] = None,
+            chunksize: Optional[int] = None
+    ):
         """
         Initialize the DATA load object with the path to the CSV
         params:
@@ -11,11 +94,19 @@ class DataHandler:
         Args:
             data_path: The path to data
             encoding: The encoding for the file content
+            cache_dir: Directory for the parquet copies of already-parsed files
+            columns: Columns to load (None loads all); the others are never parsed
+            dtype: Column dtypes for the loaded data (parsed directly from CSV, cast after reading parquet)
+            chunksize: Rows per chunk; when set, load_data returns an iterator of chunks
         """
         if not data_path:
             raise ValueError("Data path cannot be empty.")
         self.data_path = data_path
         self._encoding = encoding
+        self._cache_dir = cache_dir
+        self._columns = columns
+        self._dtype = dtype
+        self._chunksize = chunksize
 
         # Determining the DATA format
         self._loader_type = self._get_loader_type_from_path(self.data_path)
@@ -23,17 +114,34 @@ class DataHandler:
         # Determining the function we will use
         self._load_method_map = {
             "csv": self._load_csv,
+            "parquet": self._load_parquet,
         }
         self._selected_load_method = self._load_method_map[self._loader_type]
 
-    def load_data(self) -> pd.DataFrame:
+        # Chunked readers, used instead when a chunksize is set
+        self._chunk_method_map = {
+            "csv": self._iter_csv_chunks,
+            "parquet": self._iter_parquet_chunks,
+        }
+
+    def load_data(self, use_cache: bool = True) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         The function to load the data from the path we defined in init
 
+        Args:
+            use_cache: Reuse a parquet copy of the parsed file when it is still valid
+                (ignored when reading in chunks)
+
         return:
-            A pandas dataframe that holds the information
+            A pandas dataframe that holds the information, or an iterator of
+            dataframes when a chunksize was given
         """
         try:
+            if self._chunksize:
+                return self._chunk_method_map[self._loader_type]()
+            # Parquet input is already as fast to read as the cache would be
+            if use_cache and _HAS_PYARROW and self._loader_type != "parquet":
+                return self._load_with_cache()
             return self._selected_load_method()
         # There is currently no logger, so the division into errors is a bit unnecessary.
         except FileNotFoundError:
@@ -41,6 +149,71 @@ class DataHandler:
         except Exception:
             raise
 
+    def _load_with_cache(self) -> pd.DataFrame:
+        """
+        Load the data through an on-disk parquet cache.
+        The cache key covers the path, modification time, encoding, columns and dtypes,
+        so editing the source file invalidates it.
+
+        return:
+            The data
+        """
+        # Files are named <source hash>-<mtime hash>, so copies of older versions of the same
+        # source (same path and load options) can be found and evicted
+        path_key = hashlib.md5(
+            f"{self.data_path}:{self._encoding}:{self._columns}:{self._dtype}".encode()
+        ).hexdigest()
+        mtime_key = hashlib.md5(str(os.path.getmtime(self.data_path)).encode()).hexdigest()
+        cache_path = os.path.join(self._cache_dir, f"{path_key}-{mtime_key}.parquet")
+
+        if os.path.exists(cache_path):
+            try:
+                return self._restore_dtypes(pd.read_parquet(cache_path))
+            except Exception:
+                # An unreadable cache file is a miss; it is rewritten below
+                pass
+
+        data = self._selected_load_method()
+        self._write_cache(data, cache_path, path_key)
+        return data
+
+    def _write_cache(self, data: pd.DataFrame, cache_path: str, path_key: str) -> None:
+        """
+        Write the parquet cache atomically and drop older copies of the same source file.
+        A cache that cannot be written only costs speed, never the load itself.
+
+        Args:
+            data: The parsed data
+            cache_path: Final path of the cache file
+            path_key: Hash of the source path and load options shared by all of its cache files
+        """
+        tmp_path = None
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".parquet.tmp")
+            os.close(fd)
+            data.to_parquet(tmp_path, compression="zstd")
+            # A reader sees either no cache file or a complete one, never a partial write
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except Exception:
+            return
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+        # Every change to the source adds a new key, so evict the copies of older versions
+        for name in os.listdir(self._cache_dir):
+            stale_path = os.path.join(self._cache_dir, name)
+            if name.startswith(f"{path_key}-") and name.endswith(".parquet") and stale_path != cache_path:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+
     def _get_loader_type_from_path(self, path: str):
         """
         Getting the data file extension
@@ -51,6 +224,8 @@ class DataHandler:
         path_lower = path.lower()
         if path_lower.endswith(".csv"):
             return "csv"
+        elif path_lower.endswith(".parquet"):
+            return "parquet"
         else:
             raise ValueError(f"Could not determine loader type for file: {path}")
 
@@ -61,4 +236,110 @@ class DataHandler:
         return:
             The data
         """
-        return pd.read_csv(self.data_path, encoding=self._encoding)
+        if not _HAS_PYARROW:
+            return pd.read_csv(
+                self.data_path,
+                encoding=self._encoding,
+                usecols=self._columns,
+                dtype=self._dtype
+            )
+
+        # pyarrow parses the file with multiple threads. It is called directly because the
+        # pandas pyarrow engine cannot enable newlines_in_values, and tweets often contain
+        # line breaks inside quoted text (the block chunker then loses sync on larger files)
+        from pyarrow import csv as pacsv
+        table = pacsv.read_csv(
+            self.data_path,
+            read_options=pacsv.ReadOptions(encoding=self._encoding),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=self._columns,
+                null_values=_CSV_NA_VALUES,
+                strings_can_be_null=True
+            )
+        )
+        return self._to_arrow_strings(self._restore_dtypes(table.to_pandas()))
+
+    def _load_parquet(self) -> pd.DataFrame:
+        """
+        Implements the logic for loading a parquet file.
+
+        return:
+            The data
+        """
+        data = pd.read_parquet(self.data_path, columns=self._columns)
+        return self._to_arrow_strings(self._restore_dtypes(data))
+
+    def _iter_csv_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Read the CSV file chunk by chunk.
+        The pyarrow engine cannot stream, so the C parser is used here.
+
+        return:
+            Iterator of dataframes with up to chunksize rows each
+        """
+        reader = pd.read_csv(
+            self.data_path,
+            encoding=self._encoding,
+            usecols=self._columns,
+            dtype=self._dtype,
+            chunksize=self._chunksize
+        )
+        with reader:
+            for chunk in reader:
+                yield self._to_arrow_strings(chunk)
+
+    def _iter_parquet_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Read the parquet file batch by batch.
+
+        return:
+            Iterator of dataframes with up to chunksize rows each
+        """
+        import pyarrow.parquet as pq
+
+        # Keep a running row label so chunks can be told apart like CSV chunks
+        start = 0
+        parquet_file = pq.ParquetFile(self.data_path)
+        for batch in parquet_file.iter_batches(batch_size=self._chunksize, columns=self._columns):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield self._to_arrow_strings(self._restore_dtypes(chunk))
+
+    def _restore_dtypes(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast columns to the dtypes requested in the dtype map, where they differ.
+        Used for readers that cannot parse into those dtypes directly (pyarrow CSV
+        tables, parquet files and the parquet cache).
+
+        return:
+            The data, with the requested dtypes applied
+        """
+        mismatched = {
+            col: dtype for col, dtype in (self._dtype or {}).items()
+            if col in data.columns and data[col].dtype != dtype
+        }
+        if mismatched:
+            data = data.astype(mismatched)
+        return data
+
+    @staticmethod
+    def _to_arrow_strings(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert text columns to the pyarrow-backed string dtype, if pyarrow is installed.
+
+        return:
+            The data, with text columns stored as contiguous Arrow buffers
+        """
+        if not _HAS_PYARROW:
+            return data
+
+        # Columns that were already parsed as Arrow strings are left alone
+        text_columns = [
+            col for col in data.select_dtypes(include=["object", "string"]).columns
+            if data[col].dtype != TEXT_DTYPE
+        ]
+        if text_columns:
+            data[text_columns] = data[text_columns].astype(TEXT_DTYPE)
+        return data
@@ -4,18 +4,45 @@ Complete Twitter Antisemitism Analysis Script - FIXED PATHS
 Implements all requirements from the exam specification
 """
 
+import numpy as np
 import pandas as pd
+import functools
+import gc
+import heapq
 import json
-import string
+import logging
 import re
 import os
 from pathlib import Path
-from collections import Counter
-from typing import Dict, List, Any, Union
+from collections import Counter, defaultdict
+from typing import Dict, List, Any, Optional, Tuple, Union
 
-from data_loader import DataHandler
+from data_loader import DataHandler, TEXT_DTYPE, write_csv, write_csv_chunks
 from data_cleaner import DataCleaner
 from data_details import DataInformation
+from util_kernels import HAS_NUMBA, count_words_ascii
+
+# orjson is optional; it serializes in C and is used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Numbered categories -> names used in the exam results format
+CATEGORY_RENAME = {'1': 'antisemitic', '0': 'non_antisemitic'}
+
+# Result sections, in the order they appear in results.json
+EXAM_SECTIONS = ('total_tweets', 'average_length', 'common_words', 'longest_3_tweets', 'uppercase_words')
+
+# Per-section value conversion for the exam format (sections not listed are copied as-is)
+SECTION_POSTPROCESS = {'average_length': lambda value: round(value, 1)}
+
+
+@functools.cache
+def _project_root() -> Path:
+    """Project root directory (parent of src), resolved once."""
+    return Path(__file__).parent.parent
 
 
 class TwitterAnalysisComplete:
@@ -24,19 +51,20 @@ class TwitterAnalysisComplete:
     Handles all exam requirements: exploration, cleaning, and results export.
     """
 
-    def __init__(self, data_path: str, output_dir: str = None):
+    def __init__(self, data_path: str, output_dir: str = None, chunksize: Optional[int] = None):
         """
         Initialize the complete analysis pipeline.
 
         Args:
             data_path: Path to the tweets CSV file
             output_dir: Directory to save results (defaults to project/results)
+            chunksize: Rows per chunk to stream the file in (None loads it whole)
         """
         # Get the project root directory (parent of src)
-        current_dir = Path(__file__).parent
-        project_root = current_dir.parent
+        project_root = _project_root()
 
         self.data_path = Path(data_path)
+        self.chunksize = chunksize
 
         # Default output directory in project root
         if output_dir is None:
@@ -51,7 +79,7 @@ class TwitterAnalysisComplete:
         except Exception as e:
             print(f"❌ Failed to create output directory: {e}")
             # Fallback to current directory
-            self.output_dir = current_dir / "results"
+            self.output_dir = Path(__file__).parent / "results"
             self.output_dir.mkdir(exist_ok=True)
             print(f"📁 Using fallback directory: {self.output_dir}")
 
@@ -60,6 +88,19 @@ class TwitterAnalysisComplete:
         self.cleaned_data = None
         self.analysis_results = {}
 
+        # Set when step 2 streams the cleaned CSV to disk instead of keeping it in memory
+        self._cleaned_csv_path = None
+
+        # Per-category aggregates shared by the exploration helpers
+        self._category_aggregates = None
+
+        # Word frequencies sorted most frequent first, kept for repeated common-words lookups
+        self._word_counts = None
+
+        # Raw text after punctuation removal, lowercasing and whitespace cleanup, shared by
+        # the common-words metric and the cleaning step
+        self._normalized_text = None
+
         # Column mappings (flexible for different CSV structures)
         self.text_column = "Text"
         self.classification_column = "Biased"
@@ -79,13 +120,21 @@ class TwitterAnalysisComplete:
         print("STEP 1: DATA EXPLORATION")
         print("=" * 50)
 
-        # Load data
-        loader = DataHandler(str(self.data_path))
-        self.raw_data = loader.load_data()
+        if self.chunksize:
+            # Only one chunk of raw tweets is in memory at a time
+            print(f"📦 Reading in chunks of {self.chunksize:,} rows")
+            self._aggregate_in_chunks()
+        else:
+            # Load data - only the two columns the analysis uses are parsed
+            self.raw_data = self._with_categorical_labels(self._make_loader().load_data())
+
+            # Basic info
+            data_info = DataInformation(self.raw_data)
+            data_info.print_summary()
 
-        # Basic info
-        data_info = DataInformation(self.raw_data)
-        data_info.print_summary()
+            # Derived per-tweet columns and per-category aggregates, computed once for all metrics
+            self._add_text_metrics()
+            self._aggregate_by_category()
 
         exploration_results = {}
 
@@ -151,65 +200,46 @@ class TwitterAnalysisComplete:
 
         return exploration_results
 
-    def step2_data_cleaning(self) -> pd.DataFrame:
+    def step2_data_cleaning(self) -> Optional[pd.DataFrame]:
         """
         Step 2: Clean the data according to exam requirements.
 
         Returns:
-            Cleaned DataFrame
+            Cleaned DataFrame (None in chunked mode, where it is written straight to CSV)
         """
         print("\n" + "=" * 50)
         print("STEP 2: DATA CLEANING")
         print("=" * 50)
 
-        if self.raw_data is None:
+        if self._category_aggregates is None:
             raise ValueError("Must run step1_data_exploration first")
 
-        print(f"📊 Original data: {len(self.raw_data):,} rows, {len(self.raw_data.columns)} columns")
-
         # Initialize cleaner
         cleaner = DataCleaner()
 
-        # Keep only relevant columns as required by exam
-        columns_to_keep = [self.text_column, self.classification_column]
-        available_columns = [col for col in columns_to_keep if col in self.raw_data.columns]
+        if self.chunksize:
+            self._clean_in_chunks(cleaner)
+            return None
+
+        if self.raw_data is None:
+            raise ValueError("Raw data is released after cleaning; rerun step1_data_exploration first")
+
+        print(f"📊 Original data: {len(self.raw_data):,} rows, {len(self.raw_data.columns)} columns")
 
-        if len(available_columns) != len(columns_to_keep):
-            missing = set(columns_to_keep) - set(available_columns)
-            print(f"⚠️ Missing columns: {missing}")
-            raise ValueError(f"Required columns missing: {missing}")
+        # Keep only relevant columns as required by exam (the loader already pruned the
+        # CSV to these two, so this only drops the derived exploration columns)
+        columns_to_keep = [self.text_column, self.classification_column]
 
         print(f"🔽 Keeping only relevant columns: {columns_to_keep}")
-        cleaned_data = self.raw_data[available_columns].copy()
+        # No deep copy: the first cleaner call below returns a new frame that shares the
+        # raw column buffers, and only that frame is modified in place afterwards
+        cleaned_data = self.raw_data[columns_to_keep]
         print(f"   Reduced from {len(self.raw_data.columns)} to {len(cleaned_data.columns)} columns")
 
-        # Remove unclassified tweets
-        print(f"🧹 Removing unclassified tweets...")
-        original_count = len(cleaned_data)
-        cleaned_data = cleaner.delete_unclassified(cleaned_data, [self.classification_column])
-        removed_count = original_count - len(cleaned_data)
-        print(f"  Removed {removed_count:,} unclassified tweets")
-
-        # Clean text: remove punctuation
-        print(f"🧹 Removing punctuation...")
-        cleaned_data = cleaner.removing_punctuation_marks(cleaned_data, [self.text_column])
-
-        # Convert to lowercase
-        print(f"🧹 Converting to lowercase...")
-        cleaned_data = cleaner.convert_to_lowercase(cleaned_data, [self.text_column])
-
-        # Final cleanup: remove extra whitespace
-        print(f"🧹 Final whitespace cleanup...")
-        cleaned_data[self.text_column] = cleaned_data[self.text_column].apply(
-            lambda x: ' '.join(x.split()) if pd.notna(x) else x
-        )
-
-        # Remove empty text entries
-        before_empty_removal = len(cleaned_data)
-        cleaned_data = cleaned_data[cleaned_data[self.text_column].str.strip() != '']
-        empty_removed = before_empty_removal - len(cleaned_data)
-        if empty_removed > 0:
-            print(f"  Removed {empty_removed:,} empty text entries")
+        # The text was already normalized for the common-words metric during exploration
+        cleaned_data = self._clean_frame(
+            cleaned_data, cleaner, normalized_text=self._get_normalized_text()
+        )[0]
 
         # Final verification - ensure we have exactly 2 columns
         final_columns = list(cleaned_data.columns)
@@ -224,6 +254,14 @@ class TwitterAnalysisComplete:
 
         print(f"📊 Final cleaned data: {len(cleaned_data):,} rows, {len(cleaned_data.columns)} columns")
         print(f"📉 Total removed: {len(self.raw_data) - len(cleaned_data):,} rows")
+
+        # Every exploration result now lives in the aggregates, so the raw frame and its
+        # derived columns are released before exporting (helpers that re-aggregate it
+        # must therefore run before this step)
+        self.raw_data = None
+        self._normalized_text = None
+        gc.collect()
+
         print(f"✅ Data cleaning completed!")
 
         return cleaned_data
@@ -236,17 +274,18 @@ class TwitterAnalysisComplete:
         print("STEP 3: EXPORTING RESULTS")
         print("=" * 50)
 
-        if self.cleaned_data is None:
+        if self.cleaned_data is None and self._cleaned_csv_path is None:
             raise ValueError("Must run step2_data_cleaning first")
 
-        # Export cleaned CSV
-        cleaned_csv_path = self.output_dir / "tweets_dataset_cleaned.csv"
-        try:
-            self.cleaned_data.to_csv(cleaned_csv_path, index=False)
-            print(f"💾 Cleaned dataset saved: {cleaned_csv_path}")
-            print(f"   📊 {len(self.cleaned_data):,} rows, {len(self.cleaned_data.columns)} columns")
-        except Exception as e:
-            print(f"❌ Failed to save cleaned CSV: {e}")
+        # Export cleaned CSV (in chunked mode step 2 has already written it)
+        if self.cleaned_data is not None:
+            cleaned_csv_path = self.output_dir / "tweets_dataset_cleaned.csv"
+            try:
+                write_csv(self.cleaned_data, cleaned_csv_path)
+                print(f"💾 Cleaned dataset saved: {cleaned_csv_path}")
+                print(f"   📊 {len(self.cleaned_data):,} rows, {len(self.cleaned_data.columns)} columns")
+            except Exception as e:
+                print(f"❌ Failed to save cleaned CSV: {e}")
 
         # Convert to correct format for exam requirements
         correct_format_results = self._convert_to_exam_format(self.analysis_results)
@@ -254,8 +293,12 @@ class TwitterAnalysisComplete:
         # Export analysis results JSON in correct format
         results_json_path = self.output_dir / "results.json"
         try:
-            with open(results_json_path, 'w', encoding='utf-8') as f:
-                json.dump(correct_format_results, f, indent=4, ensure_ascii=False)
+            # Serialize once and write the bytes in a single call
+            if orjson is not None:
+                data = orjson.dumps(correct_format_results, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(correct_format_results, indent=2, ensure_ascii=False).encode('utf-8')
+            results_json_path.write_bytes(data)
             print(f"💾 Analysis results saved: {results_json_path}")
         except Exception as e:
             print(f"❌ Failed to save results JSON: {e}")
@@ -275,70 +318,22 @@ class TwitterAnalysisComplete:
         Returns:
             Results in exam-required format
         """
-
-        def convert_category_name(category_key):
-            if category_key == '1':
-                return 'antisemitic'
-            elif category_key == '0':
-                return 'non_antisemitic'
-            else:
-                return category_key
-
         correct_format = {}
 
-        # 1. Total tweets - convert format
-        if 'total_tweets' in analysis_data:
-            tweet_counts = analysis_data['total_tweets']
-            correct_format['total_tweets'] = {}
-
-            for key, value in tweet_counts.items():
-                if key in ['1', '0']:
-                    new_key = convert_category_name(key)
-                    correct_format['total_tweets'][new_key] = value
-                elif key == 'unspecified':
-                    correct_format['total_tweets']['unspecified'] = value
-                elif key == 'total':
-                    correct_format['total_tweets']['total'] = value
-
-        # 2. Average length - convert format and round
-        if 'average_length' in analysis_data:
-            avg_lengths = analysis_data['average_length']
-            correct_format['average_length'] = {}
-
-            for key, value in avg_lengths.items():
-                if key in ['1', '0']:
-                    new_key = convert_category_name(key)
-                    correct_format['average_length'][new_key] = round(value, 1)
-                elif key == 'total':
-                    correct_format['average_length']['total'] = round(value, 1)
-
-        # 3. Common words - IMPORTANT: exam wants it wrapped in "total" key
-        if 'common_words' in analysis_data:
-            correct_format['common_words'] = {
-                "total": analysis_data['common_words']
-            }
-
-        # 4. Longest tweets - convert format
-        if 'longest_3_tweets' in analysis_data:
-            longest_tweets = analysis_data['longest_3_tweets']
-            correct_format['longest_3_tweets'] = {}
-
-            for key, value in longest_tweets.items():
-                if key in ['1', '0']:
-                    new_key = convert_category_name(key)
-                    correct_format['longest_3_tweets'][new_key] = value
+        for section in EXAM_SECTIONS:
+            if section not in analysis_data:
+                continue
 
-        # 5. Uppercase words - convert format
-        if 'uppercase_words' in analysis_data:
-            uppercase_counts = analysis_data['uppercase_words']
-            correct_format['uppercase_words'] = {}
+            if section == 'common_words':
+                # IMPORTANT: exam wants it wrapped in "total" key
+                correct_format[section] = {"total": analysis_data[section]}
+                continue
 
-            for key, value in uppercase_counts.items():
-                if key in ['1', '0']:
-                    new_key = convert_category_name(key)
-                    correct_format['uppercase_words'][new_key] = value
-                elif key == 'total':
-                    correct_format['uppercase_words']['total'] = value
+            postprocess = SECTION_POSTPROCESS.get(section)
+            correct_format[section] = {
+                CATEGORY_RENAME.get(key, key): postprocess(value) if postprocess else value
+                for key, value in analysis_data[section].items()
+            }
 
         return correct_format
 
@@ -364,99 +359,361 @@ class TwitterAnalysisComplete:
             print(f"\n❌ ANALYSIS FAILED: {e}")
             raise
 
+    def _make_loader(self) -> DataHandler:
+        """Create the loader for the analysed columns (chunked when a chunksize is set)."""
+        # Only the two columns the analysis uses are parsed
+        return DataHandler(
+            str(self.data_path),
+            columns=[self.text_column, self.classification_column],
+            dtype={self.text_column: TEXT_DTYPE, self.classification_column: 'Int8'},
+            chunksize=self.chunksize
+        )
+
+    def _with_categorical_labels(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store the classification labels as a categorical (int8 codes for grouping).
+        The categories are taken from the labels present, so no label is turned into a missing value.
+
+        Args:
+            data: Frame with the classification column parsed as Int8
+
+        Returns:
+            The same frame, with the classification column converted
+        """
+        data[self.classification_column] = data[self.classification_column].astype('category')
+        return data
+
     def _count_tweets_by_category(self) -> Dict[str, int]:
         """Count tweets by classification category."""
-        counts = self.raw_data[self.classification_column].value_counts()
-        unspecified = self.raw_data[self.classification_column].isnull().sum()
-
-        result = {}
-        for category, count in counts.items():
-            result[str(category)] = int(count)
+        # Most frequent first, matching value_counts() ordering; the group sizes come from the
+        # one aggregation pass, so unclassified tweets are whatever the groups do not cover
+        counts = self._category_aggregates['counts'].sort_values(ascending=False, kind='stable')
+        total_rows = int(self._category_aggregates['total_rows'])
 
-        result['total'] = int(len(self.raw_data))
-        result['unspecified'] = int(unspecified)
+        result = {str(category): int(count) for category, count in counts.items()}
+        result['total'] = total_rows
+        result['unspecified'] = total_rows - int(counts.sum())
 
         return result
 
+    def _aggregate_by_category(self, top_n: int = 3) -> None:
+        """
+        Compute all per-category aggregates in one groupby over the derived columns.
+
+        Args:
+            top_n: Number of longest tweets to keep per category
+        """
+        if self.raw_data is None:
+            raise ValueError("Raw data is released after cleaning; rerun step1_data_exploration first")
+
+        grouped = self.raw_data.groupby(self.classification_column, sort=False, observed=True)
+
+        # Ordered by word count within each category
+        longest_tweets = {}
+        for category, row_label in grouped['word_count'].nlargest(top_n).index:
+            longest_tweets.setdefault(category, []).append(
+                self.raw_data.at[row_label, self.text_column]
+            )
+
+        self._word_counts = None
+        self._category_aggregates = {
+            'counts': grouped.size(),
+            'average_length': grouped['word_count'].mean(),
+            'uppercase_words': grouped['uppercase_count'].sum(),
+            'longest_tweets': longest_tweets,
+            'top_n': top_n,
+            'total_rows': len(self.raw_data),
+            'total_average_length': float(self.raw_data['word_count'].mean()),
+            'total_uppercase_words': int(self.raw_data['uppercase_count'].sum()),
+            'word_frequencies': self._word_frequencies(self._get_normalized_text()),
+        }
+
+    def _aggregate_in_chunks(self, top_n: int = 3) -> None:
+        """
+        Compute the same aggregates as _aggregate_by_category by folding them
+        over the file one chunk at a time.
+
+        Args:
+            top_n: Number of longest tweets to keep per category
+        """
+        counts: Dict[Any, int] = {}
+        word_sums = defaultdict(int)
+        uppercase_sums = defaultdict(int)
+        # Category -> (word count, -row label, text); ties go to the earlier row like nlargest
+        longest = defaultdict(list)
+        word_frequencies = Counter()
+        total_rows = total_words = total_uppercase = 0
+
+        for chunk in self._make_loader().load_data():
+            chunk = self._with_categorical_labels(chunk)
+            self._add_text_metrics(chunk)
+            grouped = chunk.groupby(self.classification_column, sort=False, observed=True)
+
+            # Categories are kept in order of first appearance, like the in-memory groupby
+            for category, size in grouped.size().items():
+                counts[category] = counts.get(category, 0) + int(size)
+            for category, words in grouped['word_count'].sum().items():
+                word_sums[category] += int(words)
+            for category, caps in grouped['uppercase_count'].sum().items():
+                uppercase_sums[category] += int(caps)
+
+            for (category, row_label), words in grouped['word_count'].nlargest(top_n).items():
+                longest[category].append((int(words), -row_label, chunk.at[row_label, self.text_column]))
+            for category in longest:
+                longest[category] = heapq.nlargest(top_n, longest[category])
+
+            total_rows += len(chunk)
+            total_words += int(chunk['word_count'].sum())
+            total_uppercase += int(chunk['uppercase_count'].sum())
+            normalized = DataCleaner.normalize_text(chunk[[self.text_column]], [self.text_column])
+            word_frequencies.update(self._word_frequencies(normalized[self.text_column]).to_dict())
+
+        self._word_counts = None
+        self._category_aggregates = {
+            'counts': pd.Series(counts, dtype='int64'),
+            'average_length': pd.Series(
+                {category: word_sums[category] / count for category, count in counts.items()},
+                dtype='float64'
+            ),
+            'uppercase_words': pd.Series(
+                {category: uppercase_sums[category] for category in counts}, dtype='int64'
+            ),
+            'longest_tweets': {
+                category: [text for _, _, text in longest[category]] for category in counts
+            },
+            'top_n': top_n,
+            'total_rows': total_rows,
+            'total_average_length': total_words / total_rows if total_rows else float('nan'),
+            'total_uppercase_words': total_uppercase,
+            'word_frequencies': pd.Series(word_frequencies, dtype='int64'),
+        }
+
+    def _add_text_metrics(self, data: Optional[pd.DataFrame] = None) -> None:
+        """
+        Add 'word_count' and 'uppercase_count' columns from a single tokenization.
+
+        Uppercase words are tokens longer than one character that are all
+        alphabetic and all uppercase.
+
+        Args:
+            data: Frame to add the columns to (defaults to the raw data)
+        """
+        if data is None:
+            data = self.raw_data
+        texts = data[self.text_column].fillna('')
+
+        if HAS_NUMBA:
+            # One compiled byte scan for ASCII tweets; the rest go through pandas
+            word_count, uppercase_count, needs_fallback = count_words_ascii(texts.tolist())
+            if needs_fallback.any():
+                word_count[needs_fallback], uppercase_count[needs_fallback] = (
+                    self._count_words_with_pandas(texts[needs_fallback])
+                )
+        else:
+            word_count, uppercase_count = self._count_words_with_pandas(texts)
+
+        data['word_count'] = word_count
+        data['uppercase_count'] = uppercase_count
+
+    @staticmethod
+    def _count_words_with_pandas(texts: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Count words and uppercase words per text with vectorized pandas string operations.
+
+        Args:
+            texts: Text column without missing values
+
+        Returns:
+            Word counts and uppercase word counts, aligned with texts
+        """
+        tokens = texts.str.split()
+        word_count = tokens.str.len().to_numpy(dtype=np.int64)
+
+        # Flatten once; explode emits one (missing) placeholder for each empty tweet
+        words = tokens.explode()
+        # Token predicates rather than a regex count: \b[A-Z]{2,}\b would also match inside
+        # tokens like "HELLO," or "#NEWS", and a fullmatch per token is slower on Arrow strings
+        is_caps = (
+            words.str.len().gt(1) & words.str.isupper() & words.str.isalpha()
+        ).fillna(False).to_numpy(dtype=bool)
+        row_positions = np.repeat(np.arange(len(tokens)), np.maximum(word_count, 1))
+
+        uppercase_count = np.bincount(
+            row_positions, weights=is_caps, minlength=len(tokens)
+        ).astype(np.int64)
+        return word_count, uppercase_count
+
     def _calculate_average_lengths(self) -> Dict[str, float]:
         """Calculate average text length by category (in words)."""
-        # Add word count column
-        self.raw_data['word_count'] = self.raw_data[self.text_column].apply(
-            lambda x: len(str(x).split()) if pd.notna(x) else 0
-        )
-
         result = {}
 
         # Calculate by category
-        for category in self.raw_data[self.classification_column].dropna().unique():
-            category_data = self.raw_data[self.raw_data[self.classification_column] == category]
-            avg_length = category_data['word_count'].mean()
+        for category, avg_length in self._category_aggregates['average_length'].items():
             result[str(category)] = float(avg_length)
 
         # Overall average
-        result['total'] = float(self.raw_data['word_count'].mean())
+        result['total'] = self._category_aggregates['total_average_length']
 
         return result
 
     def _find_longest_tweets(self, top_n: int = 3) -> Dict[str, List[str]]:
         """Find longest tweets by category."""
-        if 'word_count' not in self.raw_data.columns:
-            self.raw_data['word_count'] = self.raw_data[self.text_column].apply(
-                lambda x: len(str(x).split()) if pd.notna(x) else 0
-            )
-
-        result = {}
+        # The texts were picked by the per-category aggregation; only another top_n needs a new pass
+        if self._category_aggregates['top_n'] != top_n:
+            if self.chunksize:
+                self._aggregate_in_chunks(top_n)
+            else:
+                self._aggregate_by_category(top_n)
 
-        for category in self.raw_data[self.classification_column].dropna().unique():
-            category_data = self.raw_data[self.raw_data[self.classification_column] == category].copy()
-            longest_tweets = category_data.nlargest(top_n, 'word_count')[self.text_column].tolist()
-            result[str(category)] = longest_tweets
-
-        return result
+        return {
+            str(category): tweets
+            for category, tweets in self._category_aggregates['longest_tweets'].items()
+        }
 
     def _find_common_words(self, top_n: int = 10) -> List[str]:
         """Find most common words across all texts."""
-        # Combine all text
-        all_text = ' '.join(
-            self.raw_data[self.text_column].dropna().astype(str)
-        ).lower()
+        if self._word_counts is None:
+            # Most frequent first; ties keep first-appearance order, like value_counts()
+            self._word_counts = self._category_aggregates['word_frequencies'].sort_values(
+                ascending=False, kind='stable'
+            )
+        return self._word_counts.head(top_n).index.tolist()
 
-        # Remove punctuation and split
-        translator = str.maketrans('', '', string.punctuation)
-        clean_text = all_text.translate(translator)
-        words = clean_text.split()
+    def _get_normalized_text(self) -> pd.Series:
+        """
+        Raw text without punctuation, lowercased and whitespace-collapsed, computed once.
 
-        # Filter words (minimum length 2, alphabetic only)
-        filtered_words = [word for word in words if len(word) >= 2 and word.isalpha()]
+        Returns:
+            Normalized text column aligned with the raw data (missing text becomes empty)
+        """
+        if self._normalized_text is None:
+            self._normalized_text = DataCleaner.normalize_text(
+                self.raw_data[[self.text_column]], [self.text_column]
+            )[self.text_column]
+        return self._normalized_text
+
+    @staticmethod
+    def _word_frequencies(normalized: pd.Series) -> pd.Series:
+        """
+        Count word occurrences for the common-words metric.
 
-        # Count and return top N
-        word_counts = Counter(filtered_words)
-        return [word for word, count in word_counts.most_common(top_n)]
+        Args:
+            normalized: Text column already lowercased and stripped of punctuation
 
-    def _count_uppercase_words(self) -> Dict[str, int]:
-        """Count words in uppercase by category."""
+        Returns:
+            Count per word, in order of first appearance
+        """
+        # Without Arrow strings, explode would build one Python object per token; feeding
+        # a generator to a Counter keeps only the distinct words in memory
+        if TEXT_DTYPE.storage != 'pyarrow':
+            word_counts = Counter()
+            for text in normalized:
+                word_counts.update(word for word in text.split() if len(word) >= 2 and word.isalpha())
+            return pd.Series(word_counts, dtype='int64')
+
+        # Split per tweet, without joining into one big string
+        if normalized.dtype != TEXT_DTYPE:
+            normalized = normalized.astype(TEXT_DTYPE)
+        words = normalized.str.split().explode()
 
-        def count_caps_words(text):
-            if pd.isna(text):
-                return 0
-            words = str(text).split()
-            return sum(1 for word in words if word.isupper() and len(word) > 1 and word.isalpha())
+        # Filter words (minimum length 2, alphabetic only)
+        mask = (words.str.len() >= 2) & words.str.isalpha()
 
-        self.raw_data['uppercase_count'] = self.raw_data[self.text_column].apply(count_caps_words)
+        return words[mask.fillna(False).astype(bool)].value_counts(sort=False)
 
+    def _count_uppercase_words(self) -> Dict[str, int]:
+        """Count words in uppercase by category."""
         result = {}
 
         # Count by category
-        for category in self.raw_data[self.classification_column].dropna().unique():
-            category_data = self.raw_data[self.raw_data[self.classification_column] == category]
-            total_caps = category_data['uppercase_count'].sum()
+        for category, total_caps in self._category_aggregates['uppercase_words'].items():
             result[str(category)] = int(total_caps)
 
         # Total
-        result['total'] = int(self.raw_data['uppercase_count'].sum())
+        result['total'] = self._category_aggregates['total_uppercase_words']
 
         return result
 
+    def _clean_frame(
+            self,
+            data: pd.DataFrame,
+            cleaner: DataCleaner,
+            verbose: bool = True,
+            normalized_text: Optional[pd.Series] = None
+    ) -> Tuple[pd.DataFrame, int, int]:
+        """
+        Apply the cleaning steps to a frame holding the relevant columns.
+
+        Args:
+            data: Frame with the text and classification columns
+            cleaner: The cleaner to apply
+            verbose: Print each step as it runs
+            normalized_text: Text already normalized for these rows (skips the normalization pass)
+
+        Returns:
+            The cleaned frame, the number of unclassified tweets removed and
+            the number of empty texts removed
+        """
+        # Remove unclassified tweets
+        if verbose:
+            print(f"🧹 Removing unclassified tweets...")
+        original_count = len(data)
+        data = cleaner.delete_unclassified(data, [self.classification_column])
+        unclassified_removed = original_count - len(data)
+        if verbose:
+            print(f"  Removed {unclassified_removed:,} unclassified tweets")
+
+        # Clean text: remove punctuation, lowercase and collapse whitespace in one pass
+        if verbose:
+            print(f"🧹 Removing punctuation, lowercasing and collapsing whitespace...")
+        if normalized_text is not None:
+            # Aligned on the index, so rows removed above are simply skipped
+            data[self.text_column] = normalized_text
+        else:
+            data = cleaner.normalize_text(data, [self.text_column], inplace=True)
+
+        # Remove empty text entries (the text is already stripped, so only the length matters)
+        before_empty_removal = len(data)
+        data = data[data[self.text_column].str.len().gt(0)]
+        empty_removed = before_empty_removal - len(data)
+        if verbose and empty_removed > 0:
+            print(f"  Removed {empty_removed:,} empty text entries")
+
+        return data, unclassified_removed, empty_removed
+
+    def _clean_in_chunks(self, cleaner: DataCleaner) -> None:
+        """
+        Clean the file one chunk at a time, appending each cleaned chunk to the cleaned CSV.
+
+        Args:
+            cleaner: The cleaner to apply
+        """
+        columns_to_keep = [self.text_column, self.classification_column]
+        cleaned_csv_path = self.output_dir / "tweets_dataset_cleaned.csv"
+        removed = {'unclassified': 0, 'empty': 0}
+
+        def cleaned_chunks():
+            for chunk in self._make_loader().load_data():
+                chunk = self._with_categorical_labels(chunk)
+                cleaned, unclassified_removed, empty_removed = self._clean_frame(
+                    chunk[columns_to_keep], cleaner, verbose=False
+                )
+                removed['unclassified'] += unclassified_removed
+                removed['empty'] += empty_removed
+                yield cleaned
+
+        print(f"🧹 Cleaning in chunks of {self.chunksize:,} rows...")
+        cleaned_rows = write_csv_chunks(cleaned_chunks(), cleaned_csv_path)
+        self._cleaned_csv_path = cleaned_csv_path
+
+        print(f"  Removed {removed['unclassified']:,} unclassified tweets")
+        if removed['empty'] > 0:
+            print(f"  Removed {removed['empty']:,} empty text entries")
+        print(f"💾 Cleaned dataset saved: {cleaned_csv_path}")
+        print(f"📊 Final cleaned data: {cleaned_rows:,} rows, {len(columns_to_keep)} columns")
+        print(f"📉 Total removed: {self._category_aggregates['total_rows'] - cleaned_rows:,} rows")
+        print(f"✅ Data cleaning completed!")
+
     def _print_final_summary(self):
         """Print final summary of results."""
         print("\n" + "=" * 60)
@@ -497,13 +754,17 @@ def main():
     Main function to run the Twitter analysis.
     Update the DATA_PATH variable to match your file location.
     """
+    # Show the INFO-level summaries from the helper modules as plain lines
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # 🚨 UPDATE THIS PATH TO MATCH YOUR FILE LOCATION
     DATA_PATH = "../data/tweets_dataset.csv"  # Relative path from src directory
 
+    # Set to a row count (e.g. 1_000_000) to stream very large files in chunks
+    CHUNKSIZE = None
+
     # Try absolute path if relative doesn't work
-    current_dir = Path(__file__).parent
-    project_root = current_dir.parent
-    absolute_data_path = project_root / "data" / "tweets_dataset.csv"
+    absolute_data_path = _project_root() / "data" / "tweets_dataset.csv"
 
     # Check which path exists
     if Path(DATA_PATH).exists():
@@ -521,7 +782,8 @@ def main():
         # Create analysis instance (output will be in project/results)
         analyzer = TwitterAnalysisComplete(
             data_path=data_file_path,
-            output_dir=None  # Uses default: project/results
+            output_dir=None,  # Uses default: project/results
+            chunksize=CHUNKSIZE
         )
 
         # Run complete analysis
@@ -0,0 +1,208 @@
+# src/util_kernels.py
+"""
+Numba-compiled byte kernels for the hot text-processing loops.
+Numba is optional: without it the kernels still run as plain Python,
+so callers should check HAS_NUMBA before choosing them over the pandas path.
+"""
+
+import string
+from typing import List, Tuple
+
+import numpy as np
+
+try:
+    import numba
+    HAS_NUMBA = True
+    _njit = numba.njit
+    _prange = numba.prange
+except ImportError:
+    HAS_NUMBA = False
+    _prange = range
+
+    def _njit(*args, **kwargs):
+        return lambda func: func
+
+# Byte value written for whitespace, and the marker for bytes that are dropped
+_SPACE = 32
+_DROP = 0
+
+# ASCII bytes that str.split() treats as whitespace
+_ASCII_IS_SPACE = np.array([chr(code).isspace() for code in range(128)], dtype=np.bool_)
+
+
+def build_ascii_clean_table(punctuation: str = string.punctuation) -> np.ndarray:
+    """
+    Build the 128-entry lookup table used by the normalization kernel.
+
+    Args:
+        punctuation: Characters to drop
+
+    Returns:
+        Table mapping each ASCII byte to its cleaned byte (0 means drop, 32 means whitespace)
+    """
+    table = np.arange(128, dtype=np.uint8)
+    for code in range(128):
+        char = chr(code)
+        if char.isspace():
+            table[code] = _SPACE
+        elif char.isupper():
+            table[code] = ord(char.lower())
+    for char in punctuation:
+        table[ord(char)] = _DROP
+    return table
+
+
+@_njit(cache=True)
+def _normalize_row(buf, start, end, table, out, out_pos, write):
+    """Translate, lowercase and collapse whitespace for one row; returns the output length."""
+    length = 0
+    pending_space = False
+    for j in range(start, end):
+        c = table[buf[j]]
+        if c == _DROP:
+            continue
+        if c == _SPACE:
+            pending_space = True
+            continue
+        if pending_space and length > 0:
+            if write:
+                out[out_pos + length] = _SPACE
+            length += 1
+        pending_space = False
+        if write:
+            out[out_pos + length] = c
+        length += 1
+    return length
+
+
+@_njit(cache=True, parallel=True)
+def _clean_ascii_njit(buf, offsets, table):
+    """
+    Normalize every ASCII row of a concatenated UTF-8 buffer.
+
+    Rows containing a non-ASCII byte (or NUL, which collides with the drop marker)
+    are flagged and left empty for the caller to handle.
+    """
+    n = len(offsets) - 1
+    non_ascii = np.zeros(n, dtype=np.bool_)
+    lengths = np.zeros(n, dtype=np.int64)
+    empty = np.empty(0, dtype=np.uint8)
+
+    # Pass 1: flag rows the table cannot handle and measure the cleaned length of the others
+    for i in _prange(n):
+        for j in range(offsets[i], offsets[i + 1]):
+            if buf[j] > 127 or buf[j] == 0:
+                non_ascii[i] = True
+                break
+        if not non_ascii[i]:
+            lengths[i] = _normalize_row(buf, offsets[i], offsets[i + 1], table, empty, 0, False)
+
+    out_offsets = np.zeros(n + 1, dtype=np.int64)
+    out_offsets[1:] = np.cumsum(lengths)
+    out = np.empty(out_offsets[n], dtype=np.uint8)
+
+    # Pass 2: write each row into its own slot of the output buffer
+    for i in _prange(n):
+        if not non_ascii[i]:
+            _normalize_row(buf, offsets[i], offsets[i + 1], table, out, out_offsets[i], True)
+
+    return out, out_offsets, non_ascii
+
+
+def clean_ascii_texts(texts: List[str], table: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    """
+    Remove punctuation, lowercase and collapse whitespace for a batch of texts.
+
+    Args:
+        texts: Input texts (no missing values)
+        table: Lookup table from build_ascii_clean_table
+
+    Returns:
+        Cleaned texts (empty for flagged rows) and a boolean mask of the rows that were
+        not handled because they contain non-ASCII bytes
+    """
+    buf, offsets = _concat_utf8(texts)
+
+    out, out_offsets, non_ascii = _clean_ascii_njit(buf, offsets, table)
+
+    out_bytes = out.tobytes()
+    cleaned = [
+        out_bytes[out_offsets[i]:out_offsets[i + 1]].decode('ascii')
+        for i in range(len(texts))
+    ]
+    return cleaned, non_ascii
+
+
+@_njit(cache=True, parallel=True)
+def _scan_words_njit(buf, offsets, is_space):
+    """
+    Count words and all-uppercase words (A-Z only, length > 1) for every ASCII row.
+
+    Rows containing a non-ASCII byte are flagged and left at zero for the caller to handle.
+    """
+    n = len(offsets) - 1
+    word_count = np.zeros(n, dtype=np.int64)
+    uppercase_count = np.zeros(n, dtype=np.int64)
+    non_ascii = np.zeros(n, dtype=np.bool_)
+
+    for i in _prange(n):
+        words = 0
+        caps = 0
+        word_len = 0
+        all_caps = True
+        for j in range(offsets[i], offsets[i + 1] + 1):
+            # Treat the end of the row as whitespace so the last word is closed
+            if j == offsets[i + 1] or (buf[j] < 128 and is_space[buf[j]]):
+                if word_len > 0:
+                    words += 1
+                    if all_caps and word_len > 1:
+                        caps += 1
+                word_len = 0
+                all_caps = True
+                continue
+            c = buf[j]
+            if c > 127:
+                non_ascii[i] = True
+                break
+            word_len += 1
+            if c < 65 or c > 90:
+                all_caps = False
+        if not non_ascii[i]:
+            word_count[i] = words
+            uppercase_count[i] = caps
+
+    return word_count, uppercase_count, non_ascii
+
+
+def count_words_ascii(texts: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count words and uppercase ("shouting") words per text in a single byte scan.
+    Words are split on whitespace like str.split(); an uppercase word is longer
+    than one character and made only of A-Z.
+
+    Args:
+        texts: Input texts (no missing values)
+
+    Returns:
+        Word counts, uppercase word counts, and a boolean mask of the rows that
+        were not handled because they contain non-ASCII bytes
+    """
+    buf, offsets = _concat_utf8(texts)
+    return _scan_words_njit(buf, offsets, _ASCII_IS_SPACE)
+
+
+def _concat_utf8(texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate texts into one UTF-8 byte buffer plus row offsets.
+
+    Args:
+        texts: Input texts
+
+    Returns:
+        The byte buffer and an offsets array of length len(texts) + 1
+    """
+    encoded = [text.encode('utf-8') for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)))
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return buf, offsets